@@ -18,7 +18,8 @@ README = "README.rst"
 
 SOURCE_DIR = "src"
 
-REQUIREMENTS = ["openscm-units", "scmdata>=0.7", "tqdm"]
+REQUIREMENTS = ["numba", "openscm-units", "scmdata>=0.7", "tqdm"]
+REQUIREMENTS_PERFORMANCE = ["numexpr"]
 REQUIREMENTS_NOTEBOOKS = [
     "ipywidgets",
     "notebook",
@@ -31,6 +32,7 @@ REQUIREMENTS_TESTS = [
     "pytest-cov",
     "pytest>=4.0",
     "scipy",
+    *REQUIREMENTS_PERFORMANCE,
 ]
 REQUIREMENTS_DOCS = ["sphinx>=1.4", "sphinx_rtd_theme", "sphinx-click"]
 REQUIREMENTS_DEPLOY = ["twine>=1.11.0", "setuptools>=38.6.0", "wheel>=0.31.0"]
@@ -58,6 +60,7 @@ REQUIREMENTS_EXTRAS = {
     "dev": REQUIREMENTS_DEV,
     "docs": REQUIREMENTS_DOCS,
     "notebooks": REQUIREMENTS_NOTEBOOKS,
+    "performance": REQUIREMENTS_PERFORMANCE,
     "tests": REQUIREMENTS_TESTS,
 }
 
@@ -12,7 +12,7 @@ from openscm_units import unit_registry as ur
 from scmdata.run import ScmRun
 
 from .constants import DENSITY_WATER, HEAT_CAPACITY_WATER
-from .errors import UnitError
+from .errors import ModelStateError, UnitError
 
 # pylint: disable=invalid-name
 
@@ -70,12 +70,48 @@ class Model(ABC):
         """
         self._step()
 
+    def run_n(self, n):
+        """
+        Do ``n`` time steps.
+
+        This is equivalent to calling :meth:`step` ``n`` times but models can
+        implement it much more efficiently.
+
+        Parameters
+        ----------
+        n : int
+            Number of time steps to do
+
+        Raises
+        ------
+        ValueError
+            ``n`` is negative
+
+        ModelStateError
+            The model's state does not match its drivers or there are fewer
+            than ``n`` time steps left in the drivers. In both cases the
+            model's state is left untouched.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative, got {}".format(n))
+
+        self._check_can_run_n(n)
+        self._run_n(n)
+
+    @abstractmethod
+    def _check_can_run_n(self, n, from_start=False):
+        pass
+
+    def _run_n(self, n):
+        for _ in range(n):
+            self._step()
+
     @abstractmethod
     def _step(self):
         pass
 
 
-class TwoLayerVariant(Model):
+class TwoLayerVariant(Model):  # pylint: disable=too-many-instance-attributes
     """
     Base for variations of implementations of the two-layer model
     """
@@ -83,6 +119,14 @@ class TwoLayerVariant(Model):
     _delta_t_unit = "s"
     _erf_unit = "W/m^2"
 
+    _dtype = np.dtype(np.float64)  # floating point type of the model's state
+
+    def __init__(self):
+        """
+        Initialise
+        """
+        self._initialise_state()
+
     @property
     def delta_t(self):
         """
@@ -112,7 +156,7 @@ class TwoLayerVariant(Model):
         self._erf_mag = val.to(self._erf_unit).magnitude
 
     def set_drivers(
-        self, erf
+        self, erf, dtype=np.float64
     ):  # pylint: disable=arguments-differ # hmm need to think about this
         """
         Set drivers for a model run
@@ -122,15 +166,54 @@ class TwoLayerVariant(Model):
         erf : :obj:`pint.Quantity`
             Effective radiative forcing (W/m^2) to use to drive the model
 
+        dtype : :obj:`np.dtype`
+            Floating point type to use for the model's drivers and state.
+            ``np.float32`` halves memory use and is faster for large runs but
+            the default, ``np.float64``, should be used unless performance
+            really matters.
+
         Raises
         ------
         AssertionError
             ``erf`` is not one-dimensional
+
+        ValueError
+            ``dtype`` is not a floating point type
         """
         if len(erf.shape) != 1:
             raise AssertionError("erf must be one-dimensional")
 
+        dtype = _check_float_dtype(dtype)
+
         self.erf = erf
+        self._dtype = dtype
+        self._erf_mag = self._erf_mag.astype(self._dtype, copy=False)
+
+    def _initialise_state(self):
+        # state before any drivers are set, extended by each model
+        self._erf = np.zeros(1) * np.nan
+        self._rndt_mag = np.zeros(1) * np.nan
+        self._timestep_idx = np.nan
+
+    def _check_can_run_n(self, n, from_start=False):
+        if self._rndt_mag.shape != self.erf.shape:
+            raise ModelStateError(
+                "The model's state does not match its drivers, call "
+                ":meth:`self.reset` first."
+            )
+
+        if from_start or np.isnan(self._timestep_idx):
+            start = 0
+        else:
+            start = self._timestep_idx + 1
+
+        remaining = self.erf.shape[0] - start
+        if n > remaining:
+            raise ModelStateError(
+                "Cannot do {} steps, only {} steps remain in the drivers".format(
+                    n, remaining
+                )
+            )
 
     @staticmethod
     def _ensure_scenarios_are_scmrun(scenarios):
@@ -267,6 +350,16 @@ class TwoLayerVariant(Model):
         """Get the run output timeseries as a list"""
 
 
+def _check_float_dtype(dtype):
+    # the model's state is initialised with nan and integer state would silently
+    # truncate the results
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError("dtype must be a floating point type, got {}".format(dtype))
+
+    return dtype
+
+
 def _calculate_geoffroy_helper_parameters(  # pylint:disable=too-many-locals
     du, dl, lambda0, efficacy, eta
 ):
@@ -4,15 +4,165 @@ Module containing the impulse response model
 The 2-timescale impulse response model is mathematically equivalent to the
 two-layer model without state dependence.
 """
+import functools
+
 import numpy as np
+from numba import njit, prange, vectorize
 from openscm_units import unit_registry as ur
 
-from .base import TwoLayerVariant, _calculate_geoffroy_helper_parameters
+from .base import (
+    TwoLayerVariant,
+    _calculate_geoffroy_helper_parameters,
+    _check_float_dtype,
+)
 from .constants import DENSITY_WATER, HEAT_CAPACITY_WATER
 from .errors import ModelStateError
 
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
 # pylint: disable=invalid-name
 
+_NUMEXPR_MIN_ELEMENTS = 10000
+"""int : array size below which numexpr's overhead outweighs its speed up"""
+
+
+@njit(cache=True)
+def _calculate_decay_factor(delta_t, d):
+    # works on scalars and arrays, all decay factors are calculated here so
+    # they're identical whichever code path calculated them
+    return np.exp(-delta_t / d)
+
+
+@vectorize(
+    [
+        "float32(float32, float32, float32, float32, float32)",
+        "float64(float64, float64, float64, float64, float64)",
+    ],
+    cache=True,
+)
+def _calculate_next_temp_ufunc(delta_t, t, q, d, erf):
+    # a ufunc so the same function works on scalars and (broadcast) arrays
+    decay_factor = _calculate_decay_factor(delta_t, d)
+    rise = erf * q * (1 - decay_factor)
+
+    return t * decay_factor + rise
+
+
+@njit(cache=True)
+def _integrate_box(  # pylint: disable=too-many-arguments
+    erf, q, decay_factor, rise_factor, t, start, stop
+):
+    # the decay factor is constant so the box's response is a first-order
+    # linear recurrence. rise_factor is ``1 - decay_factor``, it is passed in so
+    # that it can be calculated before any cast to lower precision (it suffers
+    # from cancellation for long timescales).
+    if start == 0 and stop > 0:
+        t[0] = 0.0
+        start = 1
+
+    for i in range(start, stop):
+        # same operation order as _calculate_next_temp_ufunc so that running and
+        # stepping give identical results
+        t[i] = t[i - 1] * decay_factor + erf[i - 1] * q * rise_factor
+
+
+@njit(cache=True, parallel=True)
+def _integrate_box_ensemble(erf, q, decay_factor, rise_factor, t):
+    # members are independent so can be integrated in parallel, each member's
+    # timeseries is a contiguous row of ``t``
+    for k in prange(t.shape[0]):  # pylint: disable=not-an-iterable
+        _integrate_box(
+            erf, q[k], decay_factor[k], rise_factor[k], t[k], 0, erf.shape[0]
+        )
+
+
+def _calculate_rndt(  # pylint: disable=too-many-arguments
+    t1, t2, erf, efficacy, lambda0, eta, phi1, phi2
+):
+    if numexpr is not None and np.size(t1) >= _NUMEXPR_MIN_ELEMENTS:
+        # single pass without temporary arrays, same operation order as below
+        return numexpr.evaluate(
+            "erf - lambda0 * (t1 + t2) "
+            "- eta * (efficacy - 1) * ((1 - phi1) * t1 + (1 - phi2) * t2)",
+            local_dict={
+                "t1": t1,
+                "t2": t2,
+                "erf": erf,
+                "efficacy": efficacy,
+                "lambda0": lambda0,
+                "eta": eta,
+                "phi1": phi1,
+                "phi2": phi2,
+            },
+        )
+
+    efficacy_term = eta * (efficacy - 1) * ((1 - phi1) * t1 + (1 - phi2) * t2)
+
+    return erf - lambda0 * (t1 + t2) - efficacy_term
+
+
+def _calculate_two_layer_parameters(q1, q2, d1, d2, efficacy):
+    lambda0 = 1 / (q1 + q2)
+    C = (d1 * d2) / (q1 * d2 + q2 * d1)
+
+    a1 = lambda0 * q1
+    a2 = lambda0 * q2
+
+    C_D = (lambda0 * (d1 * a1 + d2 * a2) - C) / efficacy
+    eta = C_D / (d1 * a2 + d2 * a1)
+
+    du = C / (DENSITY_WATER * HEAT_CAPACITY_WATER)
+    dl = C_D / (DENSITY_WATER * HEAT_CAPACITY_WATER)
+
+    out = {
+        "lambda0": lambda0,
+        "du": du,
+        "dl": dl,
+        "eta": eta,
+        "efficacy": efficacy,
+    }
+
+    return out
+
+
+@functools.lru_cache(maxsize=1024)
+def _calculate_two_layer_parameters_from_mags(q1, q2, d1, d2, efficacy):
+    # pint quantities aren't hashable so we cache based on magnitudes in the
+    # model's units. pint quantities are also mutable (e.g. ``ito``) so we only
+    # cache magnitudes and units, callers build fresh quantities from them.
+    out = _calculate_two_layer_parameters(
+        ur.Quantity(q1, _UNITS["q1"]),
+        ur.Quantity(q2, _UNITS["q2"]),
+        ur.Quantity(d1, _UNITS["d1"]),
+        ur.Quantity(d2, _UNITS["d2"]),
+        ur.Quantity(efficacy, _UNITS["efficacy"]),
+    )
+
+    return tuple((k, v.magnitude, v.units) for k, v in out.items())
+
+
+def _calculate_rndt_paras_mag(q1, q2, d1, d2, efficacy):
+    two_layer_paras = _calculate_two_layer_parameters(q1, q2, d1, d2, efficacy)
+    gh = _calculate_geoffroy_helper_parameters(
+        two_layer_paras["du"],
+        two_layer_paras["dl"],
+        two_layer_paras["lambda0"],
+        two_layer_paras["efficacy"],
+        two_layer_paras["eta"],
+    )
+
+    out = {
+        "lambda0": two_layer_paras["lambda0"].to(_UNITS["lambda0"]).magnitude,
+        "eta": two_layer_paras["eta"].to(_UNITS["eta"]).magnitude,
+        "phi1": gh["phi1"].to(_UNITS["phi1"]).magnitude,
+        "phi2": gh["phi2"].to(_UNITS["phi2"]).magnitude,
+    }
+
+    return out
+
 
 class ImpulseResponseModel(
     TwoLayerVariant
@@ -78,11 +228,75 @@ class ImpulseResponseModel(
         if d1 >= d2:
             raise ValueError("The short-timescale must be d1")
 
-        self._erf = np.zeros(1) * np.nan
+        super().__init__()
+
+    @classmethod
+    def from_magnitudes(  # pylint: disable=too-many-arguments
+        cls, q1=0.3, q2=0.4, d1=9.0, d2=400.0, efficacy=1.0, delta_t=1 / 12
+    ):
+        """
+        Initialise from parameter magnitudes
+
+        This skips the unit checks and conversions done by :meth:`__init__` so
+        is much cheaper when creating many instances, e.g. when sampling
+        parameters. The magnitudes must already be in the model's units.
+
+        Parameters
+        ----------
+        q1 : float
+            Sensitivity of first box response to radiative forcing
+            (delta_degC/(W/m^2))
+
+        q2 : float
+            Sensitivity of second box response to radiative forcing
+            (delta_degC/(W/m^2))
+
+        d1 : float
+            Response timescale of first box (yr)
+
+        d2 : float
+            Response timescale of second box (yr)
+
+        efficacy : float
+            Efficacy factor (dimensionless)
+
+        delta_t : float
+            Time step for forward-differencing approximation (yr)
+
+        Returns
+        -------
+        :obj:`ImpulseResponseModel`
+            Initialised model
+
+        Raises
+        ------
+        ValueError
+            d1 >= d2, d1 must be the short-timescale
+        """
+        if d1 >= d2:
+            raise ValueError("The short-timescale must be d1")
+
+        out = cls.__new__(cls)
+        for name, mag in (
+            ("q1", q1),
+            ("q2", q2),
+            ("d1", d1),
+            ("d2", d2),
+            ("efficacy", efficacy),
+            ("delta_t", delta_t),
+        ):
+            setattr(out, "_{}".format(name), ur.Quantity(mag, _UNITS[name]))
+            setattr(out, "_{}_mag".format(name), mag)
+
+        out._rndt_paras_mag = None  # pylint: disable=protected-access
+        out._initialise_state()  # pylint: disable=protected-access
+
+        return out
+
+    def _initialise_state(self):
+        super()._initialise_state()
         self._temp1_mag = np.zeros(1) * np.nan
         self._temp2_mag = np.zeros(1) * np.nan
-        self._rndt_mag = np.zeros(1) * np.nan
-        self._timestep_idx = np.nan
 
     @property
     def d1(self):
@@ -94,9 +308,10 @@ class ImpulseResponseModel(
 
     @d1.setter
     def d1(self, val):
-        self._assert_is_pint_quantity_with_units(val, "d1", self._d1_unit)
+        self._assert_is_pint_quantity_with_units(val, "d1", _UNITS["d1"])
         self._d1 = val
-        self._d1_mag = val.to(self._d1_unit).magnitude
+        self._d1_mag = val.to(_UNITS["d1"]).magnitude
+        self._rndt_paras_mag = None
 
     @property
     def d2(self):
@@ -108,9 +323,10 @@ class ImpulseResponseModel(
 
     @d2.setter
     def d2(self, val):
-        self._assert_is_pint_quantity_with_units(val, "d2", self._d2_unit)
+        self._assert_is_pint_quantity_with_units(val, "d2", _UNITS["d2"])
         self._d2 = val
-        self._d2_mag = val.to(self._d2_unit).magnitude
+        self._d2_mag = val.to(_UNITS["d2"]).magnitude
+        self._rndt_paras_mag = None
 
     @property
     def q1(self):
@@ -122,9 +338,10 @@ class ImpulseResponseModel(
 
     @q1.setter
     def q1(self, val):
-        self._assert_is_pint_quantity_with_units(val, "q1", self._q1_unit)
+        self._assert_is_pint_quantity_with_units(val, "q1", _UNITS["q1"])
         self._q1 = val
-        self._q1_mag = val.to(self._q1_unit).magnitude
+        self._q1_mag = val.to(_UNITS["q1"]).magnitude
+        self._rndt_paras_mag = None
 
     @property
     def q2(self):
@@ -136,9 +353,10 @@ class ImpulseResponseModel(
 
     @q2.setter
     def q2(self, val):
-        self._assert_is_pint_quantity_with_units(val, "q2", self._q2_unit)
+        self._assert_is_pint_quantity_with_units(val, "q2", _UNITS["q2"])
         self._q2 = val
-        self._q2_mag = val.to(self._q2_unit).magnitude
+        self._q2_mag = val.to(_UNITS["q2"]).magnitude
+        self._rndt_paras_mag = None
 
     @property
     def efficacy(self):
@@ -150,9 +368,10 @@ class ImpulseResponseModel(
 
     @efficacy.setter
     def efficacy(self, val):
-        self._assert_is_pint_quantity_with_units(val, "efficacy", self._efficacy_unit)
+        self._assert_is_pint_quantity_with_units(val, "efficacy", _UNITS["efficacy"])
         self._efficacy = val
-        self._efficacy_mag = val.to(self._efficacy_unit).magnitude
+        self._efficacy_mag = val.to(_UNITS["efficacy"]).magnitude
+        self._rndt_paras_mag = None
 
     def _reset(self):
         if np.isnan(self.erf).any():
@@ -162,13 +381,49 @@ class ImpulseResponseModel(
             )
 
         self._timestep_idx = np.nan
-        self._temp1_mag = np.zeros_like(self._erf_mag) * np.nan
-        self._temp2_mag = np.zeros_like(self._erf_mag) * np.nan
-        self._rndt_mag = np.zeros_like(self._erf_mag) * np.nan
+        # one allocation for all of the state, the individual outputs are views
+        # onto its rows
+        state = np.full((3,) + self._erf_mag.shape, np.nan, dtype=self._dtype)
+        self._temp1_mag, self._temp2_mag, self._rndt_mag = state
 
     def _run(self):
-        for _ in self.erf:
-            self.step()
+        n = self._erf_mag.shape[0]
+        # check before touching the state, the compiled kernels don't
+        # bounds-check their writes
+        self._check_can_run_n(n, from_start=True)
+        self._timestep_idx = np.nan
+        self._run_n(n)
+
+    def _run_n(self, n):
+        start = 0 if np.isnan(self._timestep_idx) else self._timestep_idx + 1
+        stop = start + n
+        if stop == start:
+            return
+
+        for q_mag, d_mag, temp_mag in (
+            (self._q1_mag, self._d1_mag, self._temp1_mag),
+            (self._q2_mag, self._d2_mag, self._temp2_mag),
+        ):
+            _integrate_box(
+                self._erf_mag,
+                *self._get_box_factors(q_mag, d_mag),
+                temp_mag,
+                start,
+                stop,
+            )
+
+        # heat uptake has no memory so can be evaluated for all steps at once
+        if start == 0:
+            self._rndt_mag[0] = 0.0
+            start = 1
+
+        self._rndt_mag[start:stop] = self._calculate_next_rndt(
+            self._temp1_mag[start - 1 : stop - 1],
+            self._temp2_mag[start - 1 : stop - 1],
+            self._erf_mag[start - 1 : stop - 1],
+            self._efficacy_mag,
+        )
+        self._timestep_idx = stop - 1
 
     def _step(self):
         if np.isnan(self._timestep_idx):
@@ -183,21 +438,17 @@ class ImpulseResponseModel(
             self._rndt_mag[self._timestep_idx] = 0.0
 
         else:
-            self._temp1_mag[self._timestep_idx] = self._calculate_next_temp(
-                self._delta_t_mag,
-                self._temp1_mag[self._timestep_idx - 1],
-                self._q1_mag,
-                self._d1_mag,
-                self._erf_mag[self._timestep_idx - 1],
-            )
-
-            self._temp2_mag[self._timestep_idx] = self._calculate_next_temp(
-                self._delta_t_mag,
-                self._temp2_mag[self._timestep_idx - 1],
-                self._q2_mag,
-                self._d2_mag,
-                self._erf_mag[self._timestep_idx - 1],
-            )
+            for q_mag, d_mag, temp_mag in (
+                (self._q1_mag, self._d1_mag, self._temp1_mag),
+                (self._q2_mag, self._d2_mag, self._temp2_mag),
+            ):
+                q, decay_factor, rise_factor = self._get_box_factors(q_mag, d_mag)
+                # same operation order as _integrate_box so that stepping and
+                # running give identical results at any precision
+                temp_mag[self._timestep_idx] = (
+                    temp_mag[self._timestep_idx - 1] * decay_factor
+                    + self._erf_mag[self._timestep_idx - 1] * q * rise_factor
+                )
 
             self._rndt_mag[self._timestep_idx] = self._calculate_next_rndt(
                 self._temp1_mag[self._timestep_idx - 1],
@@ -206,42 +457,47 @@ class ImpulseResponseModel(
                 self._efficacy_mag,
             )
 
-    @staticmethod
-    def _calculate_next_temp(delta_t, t, q, d, erf):
-        decay_factor = np.exp(-delta_t / d)
-        rise = erf * q * (1 - np.exp(-delta_t / d))
-
-        return t * decay_factor + rise
+    _calculate_next_temp = staticmethod(_calculate_next_temp_ufunc)
 
-    def _calculate_next_rndt(self, t1, t2, erf, efficacy):
-        two_layer_paras = self.get_two_layer_parameters()
-        lambda0 = two_layer_paras["lambda0"]
+    def _get_box_factors(self, q_mag, d_mag):
+        # cast the parameters so the arithmetic is done in the state's
+        # precision. ``1 - decay_factor`` is calculated before the cast as it
+        # suffers from cancellation for long timescales.
+        to_dtype = self._dtype.type
+        decay_factor = _calculate_decay_factor(self._delta_t_mag, d_mag)
 
-        if np.equal(efficacy, 1):
-            efficacy_term = 0 * ur(self._erf_unit)
-        else:
-            gh = _calculate_geoffroy_helper_parameters(
-                two_layer_paras["du"],
-                two_layer_paras["dl"],
-                two_layer_paras["lambda0"],
-                two_layer_paras["efficacy"],
-                two_layer_paras["eta"],
-            )
+        return to_dtype(q_mag), to_dtype(decay_factor), to_dtype(1 - decay_factor)
 
-            t1_h = t1 * ur(self._temp1_unit)
-            t2_h = t2 * ur(self._temp2_unit)
-            efficacy_term = (
-                two_layer_paras["eta"]
-                * (efficacy - 1)
-                * ((1 - gh["phi1"]) * t1_h + (1 - gh["phi2"]) * t2_h)
-            )
+    def _get_rndt_paras_mag(self):
+        # the parameters only change when the model's parameters change so we
+        # cache their magnitudes rather than redoing the pint algebra every run
+        if self._rndt_paras_mag is not None:
+            return self._rndt_paras_mag
 
-            if str(efficacy_term.units) != "watt / meter ** 2":
-                raise AssertionError("units should have come out as W/m^2")
+        self._rndt_paras_mag = _calculate_rndt_paras_mag(
+            self.q1, self.q2, self.d1, self.d2, self.efficacy
+        )
 
-        out = erf - lambda0.magnitude * (t1 + t2) - efficacy_term.magnitude
+        return self._rndt_paras_mag
 
-        return out
+    def _calculate_next_rndt(self, t1, t2, erf, efficacy):
+        # units are handled once, when the parameters are derived, so this only
+        # has to work with magnitudes. The parameters are cast so the arithmetic
+        # is done in the state's precision whether this is called with arrays
+        # (by run) or scalars (by step).
+        rndt_paras = self._get_rndt_paras_mag()
+        to_dtype = self._dtype.type
+
+        return _calculate_rndt(
+            t1,
+            t2,
+            erf,
+            to_dtype(efficacy),
+            to_dtype(rndt_paras["lambda0"]),
+            to_dtype(rndt_paras["eta"]),
+            to_dtype(rndt_paras["phi1"]),
+            to_dtype(rndt_paras["phi2"]),
+        )
 
     def _get_run_output_tss(self, ts_base):
         out_run_tss = []
@@ -298,24 +554,193 @@ class ImpulseResponseModel(
             :obj:`openscm_twolayermodel.TwoLayerModel` with the same
             temperature response as ``self``
         """
-        lambda0 = 1 / (self.q1 + self.q2)
-        C = (self.d1 * self.d2) / (self.q1 * self.d2 + self.q2 * self.d1)
+        mags = (
+            self._q1_mag,
+            self._q2_mag,
+            self._d1_mag,
+            self._d2_mag,
+            self._efficacy_mag,
+        )
+        if not all(np.isscalar(v) for v in mags):
+            # array-valued parameters can't be hashed so can't be cached
+            return _calculate_two_layer_parameters(
+                self.q1, self.q2, self.d1, self.d2, self.efficacy
+            )
 
-        a1 = lambda0 * self.q1
-        a2 = lambda0 * self.q2
+        cached = _calculate_two_layer_parameters_from_mags(*mags)
+
+        return {k: ur.Quantity(mag, unit) for k, mag, unit in cached}
+
+
+# parsing units is slow so we only do it once
+_UNITS = {
+    **{
+        name: ur.Unit(getattr(ImpulseResponseModel, "_{}_unit".format(name)))
+        for name in (
+            "d1",
+            "d2",
+            "q1",
+            "q2",
+            "efficacy",
+            "delta_t",
+            "erf",
+            "temp1",
+            "temp2",
+            "rndt",
+        )
+    },
+    # units of the derived parameters used to calculate heat uptake
+    "lambda0": ur.Unit("W/m^2/delta_degC"),
+    "eta": ur.Unit("W/m^2/delta_degC"),
+    "phi1": ur.Unit("dimensionless"),
+    "phi2": ur.Unit("dimensionless"),
+}
+
+
+def ensemble_run(  # pylint: disable=too-many-arguments,too-many-locals,protected-access
+    erf,
+    q1,
+    q2,
+    d1,
+    d2,
+    efficacy=1.0 * ur("dimensionless"),
+    delta_t=1 / 12 * ur("yr"),
+    dtype=np.float64,
+):
+    """
+    Run an ensemble of impulse response models with the same drivers
 
-        C_D = (lambda0 * (self.d1 * a1 + self.d2 * a2) - C) / self.efficacy
-        eta = C_D / (self.d1 * a2 + self.d2 * a1)
+    This is equivalent to running an :obj:`ImpulseResponseModel` for each set
+    of parameters but all ensemble members are integrated together, in
+    parallel, which is much faster for large ensembles (e.g. when sampling
+    parameters).
 
-        du = C / (DENSITY_WATER * HEAT_CAPACITY_WATER)
-        dl = C_D / (DENSITY_WATER * HEAT_CAPACITY_WATER)
+    Parameters
+    ----------
+    erf : :obj:`pint.Quantity`
+        Effective radiative forcing (W/m^2) to use to drive the models, must be
+        one-dimensional
 
-        out = {
-            "lambda0": lambda0,
-            "du": du,
-            "dl": dl,
-            "eta": eta,
-            "efficacy": self.efficacy,
-        }
+    q1 : :obj:`pint.Quantity`
+        Sensitivity of first box response to radiative forcing for each member
 
-        return out
+    q2 : :obj:`pint.Quantity`
+        Sensitivity of second box response to radiative forcing for each member
+
+    d1 : :obj:`pint.Quantity`
+        Response timescale of first box for each member
+
+    d2 : :obj:`pint.Quantity`
+        Response timescale of second box for each member
+
+    efficacy : :obj:`pint.Quantity`
+        Efficacy factor for each member
+
+    delta_t : :obj:`pint.Quantity`
+        Time step for forward-differencing approximation
+
+    dtype : :obj:`np.dtype`
+        Floating point type to use for the calculations. ``np.float32`` halves
+        memory use and is faster for large ensembles but the default,
+        ``np.float64``, should be used unless performance really matters.
+
+    Returns
+    -------
+    dict of str : :obj:`pint.Quantity`
+        Output timeseries, keyed by variable name. Each output has shape
+        ``(n_members, n_timesteps)``.
+
+    Raises
+    ------
+    AssertionError
+        ``erf`` is not one-dimensional or the parameters can't be broadcast to
+        one-dimensional arrays
+
+    ValueError
+        d1 >= d2 for any member, d1 must be the short-timescale or ``dtype`` is
+        not a floating point type
+    """
+    if len(erf.shape) != 1:
+        raise AssertionError("erf must be one-dimensional")
+
+    dtype = _check_float_dtype(dtype)
+
+    inputs = {
+        "erf": erf,
+        "q1": q1,
+        "q2": q2,
+        "d1": d1,
+        "d2": d2,
+        "efficacy": efficacy,
+        "delta_t": delta_t,
+    }
+    mags = {}
+    for name, val in inputs.items():
+        ImpulseResponseModel._assert_is_pint_quantity_with_units(
+            val, name, _UNITS[name]
+        )
+        mags[name] = np.asarray(val.to(_UNITS[name]).magnitude, dtype=float)
+
+    # copy so we have contiguous arrays to pass to the compiled kernels
+    q1_mag, q2_mag, d1_mag, d2_mag, efficacy_mag = [
+        np.array(v)
+        for v in np.broadcast_arrays(
+            *[np.atleast_1d(mags[k]) for k in ("q1", "q2", "d1", "d2", "efficacy")]
+        )
+    ]
+    if len(q1_mag.shape) != 1:
+        raise AssertionError("parameters must be one-dimensional")
+
+    if (d1_mag >= d2_mag).any():
+        raise ValueError("The short-timescale must be d1")
+
+    erf_mag = mags["erf"].astype(dtype)
+    delta_t_mag = mags["delta_t"]
+
+    t1 = np.empty((q1_mag.shape[0], erf_mag.shape[0]), dtype=dtype)
+    t2 = np.empty_like(t1)
+    for q_mag, d_mag, t in ((q1_mag, d1_mag, t1), (q2_mag, d2_mag, t2)):
+        # one exponential per member, evaluated in double precision before
+        # entering the kernel
+        decay_factor = _calculate_decay_factor(delta_t_mag, d_mag)
+        _integrate_box_ensemble(
+            erf_mag,
+            q_mag.astype(dtype),
+            decay_factor.astype(dtype),
+            (1 - decay_factor).astype(dtype),
+            t,
+        )
+
+    rndt_paras = _calculate_rndt_paras_mag(
+        ur.Quantity(q1_mag, _UNITS["q1"]),
+        ur.Quantity(q2_mag, _UNITS["q2"]),
+        ur.Quantity(d1_mag, _UNITS["d1"]),
+        ur.Quantity(d2_mag, _UNITS["d2"]),
+        ur.Quantity(efficacy_mag, _UNITS["efficacy"]),
+    )
+    # column vectors so they broadcast along each member's timeseries
+    rndt_paras = {
+        k: np.asarray(v, dtype=dtype)[:, np.newaxis] for k, v in rndt_paras.items()
+    }
+
+    rndt = np.empty_like(t1)
+    rndt[:, :1] = 0.0
+    rndt[:, 1:] = _calculate_rndt(
+        t1[:, :-1],
+        t2[:, :-1],
+        erf_mag[:-1],
+        efficacy_mag.astype(dtype)[:, np.newaxis],
+        rndt_paras["lambda0"],
+        rndt_paras["eta"],
+        rndt_paras["phi1"],
+        rndt_paras["phi2"],
+    )
+
+    out = {
+        "Surface Temperature|Box 1": ur.Quantity(t1, _UNITS["temp1"]),
+        "Surface Temperature|Box 2": ur.Quantity(t2, _UNITS["temp2"]),
+        "Surface Temperature": ur.Quantity(t1 + t2, _UNITS["temp1"]),
+        "Heat Uptake": ur.Quantity(rndt, _UNITS["rndt"]),
+    }
+
+    return out
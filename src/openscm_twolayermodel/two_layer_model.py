@@ -71,11 +71,12 @@ class TwoLayerModel(TwoLayerVariant):  # pylint: disable=too-many-instance-attri
         self.eta = eta
         self.delta_t = delta_t
 
-        self._erf = np.zeros(1) * np.nan
+        super().__init__()
+
+    def _initialise_state(self):
+        super()._initialise_state()
         self._temp_upper_mag = np.zeros(1) * np.nan
         self._temp_lower_mag = np.zeros(1) * np.nan
-        self._rndt_mag = np.zeros(1) * np.nan
-        self._timestep_idx = np.nan
 
     @property
     def du(self):
@@ -191,9 +192,9 @@ class TwoLayerModel(TwoLayerVariant):  # pylint: disable=too-many-instance-attri
             )
 
         self._timestep_idx = np.nan
-        self._temp_upper_mag = np.zeros_like(self._erf_mag) * np.nan
-        self._temp_lower_mag = np.zeros_like(self._erf_mag) * np.nan
-        self._rndt_mag = np.zeros_like(self._erf_mag) * np.nan
+        self._temp_upper_mag = np.full(self._erf_mag.shape, np.nan, dtype=self._dtype)
+        self._temp_lower_mag = np.full(self._erf_mag.shape, np.nan, dtype=self._dtype)
+        self._rndt_mag = np.full(self._erf_mag.shape, np.nan, dtype=self._dtype)
 
     def _run(self):
         for _ in self.erf:
@@ -1,3 +1,5 @@
+import re
+
 import numpy as np
 import numpy.testing as npt
 import pytest
@@ -7,6 +9,12 @@ from test_model_base import TwoLayerVariantTester
 from openscm_twolayermodel import ImpulseResponseModel, TwoLayerModel
 from openscm_twolayermodel.base import _calculate_geoffroy_helper_parameters
 from openscm_twolayermodel.constants import DENSITY_WATER, HEAT_CAPACITY_WATER
+from openscm_twolayermodel.errors import ModelStateError
+from openscm_twolayermodel.impulse_response_model import (
+    _calculate_rndt,
+    _calculate_two_layer_parameters_from_mags,
+    ensemble_run,
+)
 
 
 class TestImpulseResponseModel(TwoLayerVariantTester):
@@ -48,6 +56,47 @@ class TestImpulseResponseModel(TwoLayerVariantTester):
         with pytest.raises(ValueError, match=error_msg):
             self.tmodel(**init_kwargs)
 
+    def test_from_magnitudes(self):
+        init_kwargs = dict(
+            q1=0.3 * ur("delta_degC/(W/m^2)"),
+            q2=0.4 * ur("delta_degC/(W/m^2)"),
+            d1=25.0 * ur("yr"),
+            d2=300 * ur("yr"),
+            efficacy=1.1 * ur("dimensionless"),
+            delta_t=1 / 12 * ur("yr"),
+        )
+
+        res = self.tmodel.from_magnitudes(
+            **{k: v.magnitude for k, v in init_kwargs.items()}
+        )
+        expected = self.tmodel(**init_kwargs)
+
+        for k, v in init_kwargs.items():
+            assert getattr(res, k) == v, "{} not set properly".format(k)
+            assert getattr(res, "_{}_mag".format(k)) == getattr(
+                expected, "_{}_mag".format(k)
+            )
+
+        assert np.isnan(res.erf)
+        assert np.isnan(res._temp1_mag)
+        assert np.isnan(res._temp2_mag)
+        assert np.isnan(res._rndt_mag)
+
+        terf = np.array([0, 1, 2, 3.5, 3.5]) * ur("W/m^2")
+        for model in (res, expected):
+            model.set_drivers(terf)
+            model.reset()
+            model.run()
+
+        npt.assert_equal(res._temp1_mag, expected._temp1_mag)
+        npt.assert_equal(res._temp2_mag, expected._temp2_mag)
+        npt.assert_equal(res._rndt_mag, expected._rndt_mag)
+
+    def test_from_magnitudes_backwards_timescales_error(self):
+        error_msg = "The short-timescale must be d1"
+        with pytest.raises(ValueError, match=error_msg):
+            self.tmodel.from_magnitudes(d1=250.0, d2=3.0)
+
     def test_calculate_next_temp(self, check_same_unit):
         tdelta_t = 30 * 24 * 60 * 60
         ttemp = 0.1
@@ -72,6 +121,38 @@ class TestImpulseResponseModel(TwoLayerVariantTester):
             (1.0 * ur(self.tmodel._erf_unit) * 1.0 * ur(self.tmodel._q1_unit)).units,
         )
 
+    def test_calculate_next_temp_partial_decay(self):
+        # timestep much shorter than the timescale so both the decay and the
+        # rise terms contribute
+        tdelta_t = 1 / 12
+        ttemp = 0.1
+        tq = 0.4
+        td = 35.0
+        tf = 1.2
+
+        res = self.tmodel._calculate_next_temp(tdelta_t, ttemp, tq, td, tf)
+
+        decay_factor = np.exp(-tdelta_t / td)
+        expected = ttemp * decay_factor + tf * tq * (1 - decay_factor)
+
+        assert 0 < ttemp * decay_factor < res
+        npt.assert_allclose(res, expected, rtol=1e-14)
+
+    def test_calculate_next_temp_broadcasts(self):
+        tdelta_t = 1 / 12
+        ttemp = np.array([0.1, 0.3, 0.0])
+        tq = np.array([0.4, 0.3, 0.5])
+        td = np.array([35.0, 4.0, 400.0])
+        tf = 1.2
+
+        res = self.tmodel._calculate_next_temp(tdelta_t, ttemp, tq, td, tf)
+
+        expected = [
+            self.tmodel._calculate_next_temp(tdelta_t, t, q, d, tf)
+            for t, q, d in zip(ttemp, tq, td)
+        ]
+        npt.assert_equal(res, expected)
+
     def test_calculate_next_rndt(self, check_same_unit):
         ttemp1 = 1.1
         ttemp_2 = 0.6
@@ -136,6 +217,47 @@ class TestImpulseResponseModel(TwoLayerVariantTester):
             self.tmodel._erf_unit, efficacy_term.units,
         )
 
+    def test_rndt_paras_cached(self):
+        model = self.tmodel(efficacy=1.2 * ur("dimensionless"))
+
+        def get_expected(model):
+            two_layer_paras = model.get_two_layer_parameters()
+            gh = _calculate_geoffroy_helper_parameters(
+                two_layer_paras["du"],
+                two_layer_paras["dl"],
+                two_layer_paras["lambda0"],
+                two_layer_paras["efficacy"],
+                two_layer_paras["eta"],
+            )
+
+            return {
+                "lambda0": two_layer_paras["lambda0"].to("W/m^2/delta_degC"),
+                "eta": two_layer_paras["eta"].to("W/m^2/delta_degC"),
+                "phi1": gh["phi1"].to("dimensionless"),
+                "phi2": gh["phi2"].to("dimensionless"),
+            }
+
+        def check_cache(model):
+            res = model._get_rndt_paras_mag()
+            # calculated once then re-used
+            assert model._get_rndt_paras_mag() is res
+
+            for k, v in get_expected(model).items():
+                npt.assert_allclose(res[k], v.magnitude)
+
+        check_cache(model)
+        for attr, val in (
+            ("q1", 0.5 * ur("delta_degC/(W/m^2)")),
+            ("q2", 0.2 * ur("delta_degC/(W/m^2)")),
+            ("d1", 4.0 * ur("yr")),
+            ("d2", 150.0 * ur("yr")),
+            ("efficacy", 0.8 * ur("dimensionless")),
+        ):
+            cached = model._get_rndt_paras_mag()
+            setattr(model, attr, val)
+            assert model._get_rndt_paras_mag() is not cached
+            check_cache(model)
+
     def test_step(self):
         # move to integration tests
         terf = np.array([3, 4, 5, 6, 7]) * ur("W/m^2")
@@ -187,6 +309,81 @@ class TestImpulseResponseModel(TwoLayerVariantTester):
             ),
         )
 
+    def test_run(self):
+        terf = np.array([3, 4, 5, 6, 7, 8.5, 8.5]) * ur("W/m^2")
+
+        model = self.tmodel(efficacy=1.2 * ur("dimensionless"))
+        model.set_drivers(terf)
+        model.reset()
+        model.run()
+        assert model._timestep_idx == terf.shape[0] - 1
+
+        model_stepped = self.tmodel(efficacy=1.2 * ur("dimensionless"))
+        model_stepped.set_drivers(terf)
+        model_stepped.reset()
+        for _ in terf:
+            model_stepped.step()
+
+        npt.assert_equal(model._temp1_mag, model_stepped._temp1_mag)
+        npt.assert_equal(model._temp2_mag, model_stepped._temp2_mag)
+        npt.assert_equal(model._rndt_mag, model_stepped._rndt_mag)
+
+    def test_run_constant_forcing(self):
+        # with constant forcing each box follows the analytic step response
+        tforcing = 3.7
+        terf = np.full(500, tforcing) * ur("W/m^2")
+
+        model = self.tmodel(delta_t=1 * ur("yr"))
+        model.set_drivers(terf)
+        model.reset()
+        model.run()
+
+        time = np.arange(terf.shape[0]) * model._delta_t_mag
+        for temp, q, d in (
+            (model._temp1_mag, model._q1_mag, model._d1_mag),
+            (model._temp2_mag, model._q2_mag, model._d2_mag),
+        ):
+            npt.assert_allclose(temp, q * tforcing * (1 - np.exp(-time / d)))
+
+    def test_run_step_float32(self):
+        # stepping and running share the same single precision arithmetic
+        terf = np.linspace(0, 4, 300) * ur("W/m^2")
+
+        model = self.tmodel()
+        model.set_drivers(terf, dtype=np.float32)
+        model.reset()
+        model.run()
+
+        model_stepped = self.tmodel()
+        model_stepped.set_drivers(terf, dtype=np.float32)
+        model_stepped.reset()
+        for _ in terf:
+            model_stepped.step()
+
+        npt.assert_equal(model._temp1_mag, model_stepped._temp1_mag)
+        npt.assert_equal(model._temp2_mag, model_stepped._temp2_mag)
+        npt.assert_equal(model._rndt_mag, model_stepped._rndt_mag)
+
+    def test_run_not_reset_error(self):
+        model = self.tmodel()
+        model.set_drivers(np.array([0, 1, 2]) * ur("W/m^2"))
+
+        error_msg = re.escape(
+            "The model's state does not match its drivers, call "
+            ":meth:`self.reset` first."
+        )
+        with pytest.raises(ModelStateError, match=error_msg):
+            model.run()
+
+        # a failed run leaves the model's state untouched
+        model.reset()
+        model.run()
+        model.set_drivers(np.array([0, 1, 2, 3]) * ur("W/m^2"))
+        with pytest.raises(ModelStateError, match=error_msg):
+            model.run()
+
+        assert model._timestep_idx == 2
+
     def test_reset(self):
         terf = np.array([0, 1, 2]) * ur("W/m^2")
 
@@ -221,7 +418,7 @@ class TestImpulseResponseModel(TwoLayerVariantTester):
         assert_is_nan_and_erf_shape(model._rndt_mag)
 
         def assert_ge_zero_and_erf_shape(inp):
-            assert not (inp < 0).any()
+            assert inp.min() >= 0
             assert inp.shape == terf.shape
 
         model.run()
@@ -275,3 +472,167 @@ class TestImpulseResponseModel(TwoLayerVariantTester):
         circular_params = TwoLayerModel(**res).get_impulse_response_parameters()
         for k, v in circular_params.items():
             check_equal_pint(v, start_paras[k])
+
+
+def test_ensemble_run():
+    terf = np.array([0, 1, 2, 3.5, 3.5, 4, 2]) * ur("W/m^2")
+    members = [
+        dict(q1=0.3, q2=0.4, d1=9.0, d2=400.0, efficacy=1.0),
+        dict(q1=0.33, q2=0.41, d1=4.1, d2=239.0, efficacy=1.2),
+        dict(q1=0.5, q2=0.3, d1=30.0, d2=600.0, efficacy=0.9),
+    ]
+    delta_t = 1 * ur("yr")
+
+    res = ensemble_run(
+        terf,
+        q1=np.array([m["q1"] for m in members]) * ur("delta_degC/(W/m^2)"),
+        q2=np.array([m["q2"] for m in members]) * ur("delta_degC/(W/m^2)"),
+        d1=np.array([m["d1"] for m in members]) * ur("yr"),
+        d2=np.array([m["d2"] for m in members]) * ur("yr"),
+        efficacy=np.array([m["efficacy"] for m in members]) * ur("dimensionless"),
+        delta_t=delta_t,
+    )
+
+    for i, member in enumerate(members):
+        model = ImpulseResponseModel.from_magnitudes(
+            delta_t=delta_t.magnitude, **member
+        )
+        model.set_drivers(terf)
+        model.reset()
+        model.run()
+
+        npt.assert_equal(
+            res["Surface Temperature|Box 1"][i].to("delta_degC").magnitude,
+            model._temp1_mag,
+        )
+        npt.assert_equal(
+            res["Surface Temperature|Box 2"][i].to("delta_degC").magnitude,
+            model._temp2_mag,
+        )
+        npt.assert_equal(
+            res["Surface Temperature"][i].to("delta_degC").magnitude,
+            model._temp1_mag + model._temp2_mag,
+        )
+        npt.assert_equal(res["Heat Uptake"][i].to("W/m^2").magnitude, model._rndt_mag)
+
+
+def test_ensemble_run_float32():
+    terf = np.array([0, 1, 2, 3.5, 3.5, 4, 2]) * ur("W/m^2")
+    paras = dict(
+        q1=np.array([0.3, 0.33]) * ur("delta_degC/(W/m^2)"),
+        q2=np.array([0.4, 0.41]) * ur("delta_degC/(W/m^2)"),
+        d1=np.array([9.0, 4.1]) * ur("yr"),
+        d2=np.array([400.0, 239.0]) * ur("yr"),
+        efficacy=np.array([1.0, 1.2]) * ur("dimensionless"),
+    )
+
+    res = ensemble_run(terf, dtype=np.float32, **paras)
+    expected = ensemble_run(terf, **paras)
+
+    for k, v in res.items():
+        assert v.magnitude.dtype == np.float32
+        assert expected[k].magnitude.dtype == np.float64
+        npt.assert_allclose(v.magnitude, expected[k].magnitude, rtol=1e-5)
+
+
+def test_ensemble_run_backwards_timescales_error():
+    error_msg = "The short-timescale must be d1"
+    with pytest.raises(ValueError, match=error_msg):
+        ensemble_run(
+            np.array([0, 1, 2]) * ur("W/m^2"),
+            q1=np.array([0.3, 0.3]) * ur("delta_degC/(W/m^2)"),
+            q2=np.array([0.4, 0.4]) * ur("delta_degC/(W/m^2)"),
+            d1=np.array([9.0, 250.0]) * ur("yr"),
+            d2=np.array([400.0, 3.0]) * ur("yr"),
+        )
+
+
+def test_ensemble_run_erf_not_one_dimensional_error():
+    with pytest.raises(AssertionError, match="erf must be one-dimensional"):
+        ensemble_run(
+            np.array([[0, 1, 2]]) * ur("W/m^2"),
+            q1=0.3 * ur("delta_degC/(W/m^2)"),
+            q2=0.4 * ur("delta_degC/(W/m^2)"),
+            d1=9.0 * ur("yr"),
+            d2=400.0 * ur("yr"),
+        )
+
+
+def test_ensemble_run_dtype_not_float_error():
+    error_msg = "dtype must be a floating point type, got int64"
+    with pytest.raises(ValueError, match=error_msg):
+        ensemble_run(
+            np.array([0, 1, 2]) * ur("W/m^2"),
+            q1=0.3 * ur("delta_degC/(W/m^2)"),
+            q2=0.4 * ur("delta_degC/(W/m^2)"),
+            d1=9.0 * ur("yr"),
+            d2=400.0 * ur("yr"),
+            dtype=np.int64,
+        )
+
+
+def test_calculate_rndt_numexpr(monkeypatch):
+    pytest.importorskip("numexpr")
+    import openscm_twolayermodel.impulse_response_model as irm
+
+    rng = np.random.default_rng(0)
+    t1 = rng.random((4, 10))
+    t2 = rng.random((4, 10))
+    erf = rng.random(10)
+    paras = dict(
+        efficacy=np.array([[1.0], [1.1], [0.9], [1.3]]),
+        lambda0=np.array([[1.2], [1.1], [0.9], [1.3]]),
+        eta=np.array([[0.7], [0.8], [0.6], [0.5]]),
+        phi1=np.array([[1.1], [1.2], [1.05], [1.3]]),
+        phi2=np.array([[-0.1], [-0.2], [-0.3], [-0.05]]),
+    )
+
+    monkeypatch.setattr(irm, "numexpr", None)
+    expected = _calculate_rndt(t1, t2, erf, **paras)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(irm, "_NUMEXPR_MIN_ELEMENTS", 0)
+    res = _calculate_rndt(t1, t2, erf, **paras)
+
+    npt.assert_allclose(res, expected)
+
+
+def test_get_two_layer_parameters_cached():
+    paras = dict(
+        q1=0.31 * ur("delta_degC/(W/m^2)"),
+        q2=0.42 * ur("delta_degC/(W/m^2)"),
+        d1=7.0 * ur("yr"),
+        d2=350.0 * ur("yr"),
+        efficacy=1.1 * ur("dimensionless"),
+    )
+
+    first = ImpulseResponseModel(**paras).get_two_layer_parameters()
+    hits = _calculate_two_layer_parameters_from_mags.cache_info().hits
+
+    second = ImpulseResponseModel(**paras).get_two_layer_parameters()
+    assert _calculate_two_layer_parameters_from_mags.cache_info().hits == hits + 1
+    assert first == second
+
+    # modifying the output doesn't affect the cache
+    second["lambda0"] = 0 * ur("W/m^2/delta_degC")
+    assert ImpulseResponseModel(**paras).get_two_layer_parameters() == first
+
+    # including in-place modification of the returned quantities
+    second = ImpulseResponseModel(**paras).get_two_layer_parameters()
+    second["du"].ito("km")
+    third = ImpulseResponseModel(**paras).get_two_layer_parameters()
+    assert third["du"].units == first["du"].units
+    assert third["du"].magnitude == first["du"].magnitude
+
+
+def test_get_two_layer_parameters_array_parameters():
+    # array-valued parameters skip the cache but give the same answer
+    q1 = 0.3 * ur("delta_degC/(W/m^2)")
+    expected = ImpulseResponseModel(q1=q1).get_two_layer_parameters()
+
+    res = ImpulseResponseModel(q1=np.array([q1.magnitude]) * q1.units)
+    res = res.get_two_layer_parameters()
+
+    assert res.keys() == expected.keys()
+    for k, v in res.items():
+        npt.assert_allclose(v.to(expected[k].units).magnitude, [expected[k].magnitude])
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from unittest.mock import MagicMock
 
 import numpy as np
+import numpy.testing as npt
 import pint.errors
 import pytest
 from openscm_units import unit_registry as ur
@@ -84,6 +85,96 @@ class TwoLayerVariantTester(ModelTester):
         with pytest.raises(TypeError, match="erf must be a pint.Quantity"):
             res.erf = terf
 
+    def test_run_n(self):
+        terf = np.array([0, 1, 2, 3.5, 3.5, 4, 2]) * ur("W/m^2")
+
+        res = self.tmodel()
+        res.set_drivers(terf)
+        res.reset()
+        res.run_n(3)
+        assert res._timestep_idx == 2
+        res.step()
+        res.run_n(0)
+        assert res._timestep_idx == 3
+        res.run_n(3)
+        assert res._timestep_idx == 6
+
+        expected = self.tmodel()
+        expected.set_drivers(terf)
+        expected.reset()
+        for _ in terf:
+            expected.step()
+
+        npt.assert_equal(res._rndt_mag, expected._rndt_mag)
+
+    def test_run_n_negative_error(self):
+        res = self.tmodel()
+        res.set_drivers(np.array([0, 1, 2]) * ur("W/m^2"))
+        res.reset()
+
+        with pytest.raises(ValueError, match="n must be non-negative, got -1"):
+            res.run_n(-1)
+
+    def test_run_n_too_many_steps_error(self):
+        model = self.tmodel()
+        model.set_drivers(np.array([0, 1, 2, 3]) * ur("W/m^2"))
+        model.reset()
+        model.step()
+
+        error_msg = "Cannot do 4 steps, only 3 steps remain in the drivers"
+        with pytest.raises(ModelStateError, match=error_msg):
+            model.run_n(4)
+
+        # the model's state is untouched
+        assert model._timestep_idx == 0
+        assert np.isnan(model._rndt_mag[1:]).all()
+
+    def test_run_n_not_reset_error(self):
+        model = self.tmodel()
+        model.set_drivers(np.array([0, 1, 2]) * ur("W/m^2"))
+
+        error_msg = re.escape(
+            "The model's state does not match its drivers, call "
+            ":meth:`self.reset` first."
+        )
+        with pytest.raises(ModelStateError, match=error_msg):
+            model.run_n(1)
+
+    def test_set_drivers_dtype(self):
+        terf = np.array([0, 1, 2, 3.5, 3.5, 4]) * ur("W/m^2")
+
+        res = self.tmodel()
+        res.set_drivers(terf, dtype=np.float32)
+        res.reset()
+        assert res._rndt_mag.dtype == np.float32
+        res.run()
+
+        expected = self.tmodel()
+        expected.set_drivers(terf)
+        expected.reset()
+        expected.run()
+
+        assert res._erf_mag.dtype == np.float32
+        assert res._rndt_mag.dtype == np.float32
+        assert expected._rndt_mag.dtype == np.float64
+        npt.assert_allclose(res._rndt_mag, expected._rndt_mag, rtol=1e-5)
+
+        # stepping and running agree in single precision too
+        stepped = self.tmodel()
+        stepped.set_drivers(terf, dtype=np.float32)
+        stepped.reset()
+        for _ in terf:
+            stepped.step()
+
+        npt.assert_equal(stepped._rndt_mag, res._rndt_mag)
+
+    def test_set_drivers_dtype_not_float_error(self):
+        res = self.tmodel()
+
+        error_msg = "dtype must be a floating point type, got int64"
+        with pytest.raises(ValueError, match=error_msg):
+            res.set_drivers(np.array([0, 1, 2]) * ur("W/m^2"), dtype=np.int64)
+
     def test_reset_not_set_error(self):
         error_msg = "The model's drivers have not been set yet, call :meth:`self.set_drivers` first."
         with pytest.raises(ModelStateError, match=error_msg):
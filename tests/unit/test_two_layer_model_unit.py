@@ -341,7 +341,7 @@ class TestTwoLayerModel(TwoLayerVariantTester):
         assert_is_nan_and_erf_shape(model._rndt_mag)
 
         def assert_ge_zero_and_erf_shape(inp):
-            assert not (inp < 0).any()
+            assert inp.min() >= 0
             assert inp.shape == terf.shape
 
         model.run()